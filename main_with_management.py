@@ -55,11 +55,17 @@ except ImportError:
 
     config = SimpleConfig()
 
-from professional_invoice_manager.db import get_db, init_database
+from professional_invoice_manager.db import (
+    close_db,
+    get_db,
+    init_database,
+    transaction,
+)
 from professional_invoice_manager.dialogs import (
     InvoiceFormDialog,
     PartnerFormDialog,
     ProductFormDialog,
+    invalidate_partners_cache,
 )
 from professional_invoice_manager.pages import (
     InvoiceListPage,
@@ -83,7 +89,162 @@ def format_date(timestamp_or_str):
             return str(timestamp_or_str)
     except:
         return str(timestamp_or_str)
- 
+
+
+# Status bar messages for page navigation
+STATUS_INVOICES = "📋 Számlák listája"
+STATUS_PRODUCTS = "🛍️ Termékek kezelése"
+STATUS_CUSTOMERS = "👥 Vevők kezelése"
+STATUS_SUPPLIERS = "🏭 Beszállítók kezelése"
+STATUS_REFRESHED = "🔄 Lista frissítve"
+STATUS_SELECTION_CLEARED = "✨ Kijelölés törölve"
+
+# Alt+Arrow keys handled by keyPressEvent, mapped to menu navigation direction
+ALT_NAV_KEYS = {
+    Qt.Key_Left: "left",
+    Qt.Key_Right: "right",
+}
+
+# INSERT statements for the "new ..." actions, bound by name from dialog data
+INSERT_STATEMENTS = {
+    "invoice": """
+        INSERT INTO invoice (number, direction, partner_id, created_utc)
+        VALUES (:number, :direction, :partner_id, :created_utc)
+    """,
+    "product": """
+        INSERT INTO product (sku, name, unit_price_cents, vat_rate)
+        VALUES (:sku, :name, :unit_price_cents, :vat_rate)
+    """,
+    "partner": """
+        INSERT INTO partner (name, kind, tax_id, address)
+        VALUES (:name, :kind, :tax_id, :address)
+    """,
+}
+
+# Help dialog contents, built once at import
+SHORTCUTS_HTML = """
+<h2>🎹 Billentyűparancsok</h2>
+
+<h3>📋 Általános navigáció:</h3>
+<table style='font-family: monospace; margin: 10px;'>
+<tr><td><b>F1</b></td><td>Súgó megjelenítése</td></tr>
+<tr><td><b>F2</b></td><td>Számlák listája</td></tr>
+<tr><td><b>F3</b></td><td>Termékek kezelése</td></tr>
+<tr><td><b>F4</b></td><td>Vevők kezelése</td></tr>
+<tr><td><b>F5</b></td><td>Lista frissítése</td></tr>
+<tr><td><b>F6</b></td><td>Beszállítók kezelése</td></tr>
+<tr><td><b>Escape</b></td><td>Visszalépés / Kijelölés törlése</td></tr>
+</table>
+
+<h3>📝 Műveletek:</h3>
+<table style='font-family: monospace; margin: 10px;'>
+<tr><td><b>Enter</b></td><td>Kiválasztott elem szerkesztése</td></tr>
+<tr><td><b>Delete</b></td><td>Kiválasztott elem törlése</td></tr>
+<tr><td><b>Insert</b></td><td>Új elem hozzáadása</td></tr>
+<tr><td><b>↑↓</b></td><td>Navigáció a listában</td></tr>
+</table>
+
+<h3>⚡ Gyorsbillentyűk:</h3>
+<table style='font-family: monospace; margin: 10px;'>
+<tr><td><b>Ctrl+N</b></td><td>Új számla</td></tr>
+<tr><td><b>Ctrl+Shift+P</b></td><td>Új termék</td></tr>
+<tr><td><b>Ctrl+Shift+C</b></td><td>Új vevő</td></tr>
+<tr><td><b>Ctrl+Shift+S</b></td><td>Új beszállító</td></tr>
+<tr><td><b>Ctrl+Q</b></td><td>Kilépés</td></tr>
+</table>
+
+<h3>🧭 Menü navigáció:</h3>
+<table style='font-family: monospace; margin: 10px;'>
+<tr><td><b>Alt + ←→</b></td><td>Menük közötti navigáció</td></tr>
+<tr><td><b>Alt + betű</b></td><td>Menü aktiválása</td></tr>
+</table>
+
+<p><i>💡 Minden funkció elérhető billentyűzetről!</i></p>
+"""
+
+ABOUT_HTML = (
+    "🎯 <b>Számlázó Rendszer v2.1</b><br><br>"
+    "🚀 <b>Management Edition</b><br><br>"
+    "✨ <b>Jellemzők:</b><br>"
+    "• 🎹 Teljes billentyűzet navigáció<br>"
+    "• 🛍️ Termékek kezelése<br>"
+    "• 👥 Vevők kezelése<br>"
+    "• 🏭 Beszállítók kezelése<br>"
+    "• 🧭 Menü navigáció nyilakkal<br>"
+    "• 🗄️ SQLite adatbázis<br>"
+    "• 📊 Számla kezelés<br>"
+    "• 🔧 Javított hibakezelés<br>"
+    "• 🎨 Professzionális megjelenés<br><br>"
+    "🔧 <b>Technológia:</b> PyQt5, SQLite<br>"
+    "📅 <b>Verzió:</b> 2.1.0<br>"
+    "© 2024 - Management Edition"
+)
+
+
+# Application-wide stylesheet, applied once in main()
+APP_STYLESHEET = """
+QMainWindow {
+    background-color: #f8f9fa;
+}
+QWidget {
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 11pt;
+}
+QPushButton {
+    background-color: #007bff;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #0056b3;
+}
+QPushButton:pressed {
+    background-color: #004085;
+}
+QMenuBar {
+    background-color: #343a40;
+    color: white;
+    font-weight: bold;
+}
+QMenuBar::item {
+    background-color: transparent;
+    padding: 8px 12px;
+}
+QMenuBar::item:selected {
+    background-color: #007bff;
+}
+QLabel#itemDialogHeader {
+    font-size: 16px;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+"""
+
+
+# Product rows offered by InvoiceItemDialog, loaded on first use
+_products_cache = None
+
+
+def get_products_cached():
+    """Return product rows for item entry, querying the database only once"""
+    global _products_cache
+    if _products_cache is None:
+        with get_db() as conn:
+            _products_cache = conn.execute("""
+                SELECT id, sku, name, unit_price_cents, vat_rate
+                FROM product ORDER BY name
+            """).fetchall()
+    return _products_cache
+
+
+def invalidate_products_cache():
+    """Drop cached product rows after products are added or changed"""
+    global _products_cache
+    _products_cache = None
+
 
 class InvoiceItemDialog(QDialog):
     """Dialog for adding/editing invoice items"""
@@ -104,7 +265,7 @@ class InvoiceItemDialog(QDialog):
         
         # Header
         header = QLabel("📦 " + ("Tétel szerkesztése" if self.item_id else "Új tétel hozzáadása"))
-        header.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        header.setObjectName("itemDialogHeader")
         layout.addWidget(header)
         
         # Form layout
@@ -151,7 +312,7 @@ class InvoiceItemDialog(QDialog):
         layout.addWidget(self.auto_fill_check)
         
         # Connect product change to auto-fill
-        self.product_combo.currentTextChanged.connect(self.on_product_changed)
+        self.product_combo.currentIndexChanged.connect(self.on_product_changed)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -168,28 +329,26 @@ class InvoiceItemDialog(QDialog):
     
     def load_products(self):
         """Load available products"""
+        self._product_index = {}
+        self._products_by_index = [None]
         try:
             self.product_combo.addItem("-- Egyedi tétel --", None)
             
-            with get_db() as conn:
-                products = conn.execute("""
-                    SELECT id, sku, name, unit_price_cents, vat_rate
-                    FROM product ORDER BY name
-                """).fetchall()
-                
-                for product in products:
-                    text = f"{product['sku']} - {product['name']}"
-                    self.product_combo.addItem(text, product)
+            for product in get_products_cached():
+                text = f"{product['sku']} - {product['name']}"
+                self._product_index[product['id']] = len(self._products_by_index)
+                self._products_by_index.append(product)
+                self.product_combo.addItem(text, product)
                     
         except Exception as e:
             QMessageBox.warning(self, "Hiba", f"Termékek betöltése sikertelen: {str(e)}")
     
-    def on_product_changed(self):
+    def on_product_changed(self, index):
         """Handle product selection change"""
-        if not self.auto_fill_check.isChecked():
+        if not self.auto_fill_check.isChecked() or index < 0:
             return
         
-        product = self.product_combo.currentData()
+        product = self._products_by_index[index]
         if product:
             self.price_spin.setValue(product['unit_price_cents'] / 100.0)
             self.vat_spin.setValue(product['vat_rate'])
@@ -197,7 +356,7 @@ class InvoiceItemDialog(QDialog):
     def on_auto_fill_changed(self, checked):
         """Handle auto-fill checkbox change"""
         if checked:
-            self.on_product_changed()
+            self.on_product_changed(self.product_combo.currentIndex())
     
     def load_data(self):
         """Load existing item data"""
@@ -212,12 +371,9 @@ class InvoiceItemDialog(QDialog):
                 
                 if item:
                     # Find and select product
-                    if item['product_id']:
-                        for i in range(self.product_combo.count()):
-                            product = self.product_combo.itemData(i)
-                            if product and product['id'] == item['product_id']:
-                                self.product_combo.setCurrentIndex(i)
-                                break
+                    index = self._product_index.get(item['product_id'])
+                    if index is not None:
+                        self.product_combo.setCurrentIndex(index)
                     
                     self.description_edit.setText(item['description'] or "")
                     self.quantity_spin.setValue(item['qty'])
@@ -234,7 +390,7 @@ class InvoiceItemDialog(QDialog):
             'product_id': product['id'] if product else None,
             'description': self.description_edit.text().strip(),
             'quantity': self.quantity_spin.value(),
-            'unit_price_cents': int(self.price_spin.value() * 100),
+            'unit_price_cents': round(self.price_spin.value() * 100),
             'vat_rate': self.vat_spin.value()
         }
     
@@ -253,7 +409,7 @@ class InvoiceItemDialog(QDialog):
             return
         
         try:
-            with get_db() as conn:
+            with transaction(immediate=True) as conn:
                 if self.item_id:
                     # Update existing item
                     conn.execute("""
@@ -270,8 +426,6 @@ class InvoiceItemDialog(QDialog):
                         VALUES (?, ?, ?, ?, ?, ?)
                     """, (self.invoice_id, data['product_id'], data['description'],
                           data['quantity'], data['unit_price_cents'], data['vat_rate']))
-                
-                conn.commit()
             
             super().accept()
             
@@ -284,26 +438,25 @@ class MenuNavigationMixin:
     
     def setup_menu_navigation(self):
         """Setup arrow key navigation for menus"""
+        self._nav_actions = []
+        self._nav_action_index = {}
         if hasattr(self, 'menuBar') and self.menuBar():
             self.menuBar().installEventFilter(self)
+            # Menus are fixed after setup_menus, so snapshot them once
+            self._nav_actions = self.menuBar().actions()
+            self._nav_action_index = {
+                action: i for i, action in enumerate(self._nav_actions)
+            }
     
     def navigate_menu(self, direction):
         """Navigate menu with arrow keys"""
-        if not hasattr(self, 'menuBar') or not self.menuBar():
-            return False
-        
-        menubar = self.menuBar()
-        actions = menubar.actions()
-        
+        actions = getattr(self, '_nav_actions', None)
         if not actions:
             return False
         
         # Find current active menu
-        current_menu = menubar.activeAction()
-        if current_menu:
-            current_index = actions.index(current_menu)
-        else:
-            current_index = 0
+        menubar = self.menuBar()
+        current_index = self._nav_action_index.get(menubar.activeAction(), 0)
         
         # Navigate
         if direction == "left":
@@ -347,14 +500,16 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
         self.list_page = InvoiceListPage(self)
         self.stack.addWidget(self.list_page)
         
-        self.product_page = ProductListPage(self)
-        self.stack.addWidget(self.product_page)
-        
-        self.customer_page = PartnerListPage("customer", self)
-        self.stack.addWidget(self.customer_page)
+        # Management pages are built on first visit by get_page()
+        self._page_factories = {
+            "products": lambda: ProductListPage(self),
+            "customers": lambda: PartnerListPage("customer", self),
+            "suppliers": lambda: PartnerListPage("supplier", self),
+        }
+        self._pages = dict.fromkeys(self._page_factories)
         
-        self.supplier_page = PartnerListPage("supplier", self)
-        self.stack.addWidget(self.supplier_page)
+        # Pages whose data changed since their last refresh
+        self._dirty = dict.fromkeys(("list", *self._page_factories), True)
         
         # Status bar
         self.status = QStatusBar()
@@ -465,68 +620,76 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
         help_menu.addAction(about_action)
     
     def setup_keyboard_shortcuts(self):
-        """Setup global keyboard shortcuts"""
-        # F-key shortcuts
-        QShortcut(QKeySequence("F1"), self).activated.connect(self.show_shortcuts)
-        QShortcut(QKeySequence("F2"), self).activated.connect(self.show_list)
-        QShortcut(QKeySequence("F3"), self).activated.connect(self.show_products)
-        QShortcut(QKeySequence("F4"), self).activated.connect(self.show_customers)
-        QShortcut(QKeySequence("F5"), self).activated.connect(self.refresh_current)
-        QShortcut(QKeySequence("F6"), self).activated.connect(self.show_suppliers)
-        
-        # Other shortcuts
+        """Setup shortcuts not covered by menu actions"""
+        # F-keys and Ctrl combos are bound on the menu actions; only
+        # Escape has no menu entry and needs its own shortcut
         QShortcut(QKeySequence("Escape"), self).activated.connect(self.go_back)
-        QShortcut(QKeySequence("Ctrl+N"), self).activated.connect(self.new_invoice)
-        QShortcut(QKeySequence("Ctrl+Shift+P"), self).activated.connect(self.new_product)
-        QShortcut(QKeySequence("Ctrl+Shift+C"), self).activated.connect(self.new_customer)
-        QShortcut(QKeySequence("Ctrl+Shift+S"), self).activated.connect(self.new_supplier)
     
     def keyPressEvent(self, event):
         """Handle global key events including menu navigation"""
-        key = event.key()
-        
         # Arrow key menu navigation
-        if event.modifiers() == Qt.AltModifier:
-            if key == Qt.Key_Left:
-                if self.navigate_menu("left"):
-                    return
-            elif key == Qt.Key_Right:
-                if self.navigate_menu("right"):
-                    return
+        direction = ALT_NAV_KEYS.get(event.key())
+        if (direction is not None
+                and event.modifiers() == Qt.AltModifier
+                and self.navigate_menu(direction)):
+            return
         
         super().keyPressEvent(event)
     
+    def closeEvent(self, event):
+        """Close the shared database connection when the window closes"""
+        close_db()
+        super().closeEvent(event)
+    
     # Page navigation methods
+    def get_page(self, name):
+        """Return a management page, building it on first use"""
+        page = self._pages[name]
+        if page is None:
+            page = self._page_factories[name]()
+            self.stack.addWidget(page)
+            self._pages[name] = page
+        return page
+    
+    def refresh_page(self, name, page):
+        """Refresh a page unless it is already shown and up to date"""
+        if self._dirty[name] or self.stack.currentWidget() is not page:
+            page.refresh()
+            self._dirty[name] = False
+    
     def show_list(self):
         """Show invoice list"""
-        self.list_page.refresh()
+        self.refresh_page("list", self.list_page)
         self.stack.setCurrentWidget(self.list_page)
-        self.status.showMessage("📋 Számlák listája")
+        self.status.showMessage(STATUS_INVOICES)
     
     def show_products(self):
         """Show product management"""
-        self.product_page.refresh()
-        self.stack.setCurrentWidget(self.product_page)
-        self.status.showMessage("🛍️ Termékek kezelése")
+        page = self.get_page("products")
+        self.refresh_page("products", page)
+        self.stack.setCurrentWidget(page)
+        self.status.showMessage(STATUS_PRODUCTS)
     
     def show_customers(self):
         """Show customer management"""
-        self.customer_page.refresh()
-        self.stack.setCurrentWidget(self.customer_page)
-        self.status.showMessage("👥 Vevők kezelése")
+        page = self.get_page("customers")
+        self.refresh_page("customers", page)
+        self.stack.setCurrentWidget(page)
+        self.status.showMessage(STATUS_CUSTOMERS)
     
     def show_suppliers(self):
         """Show supplier management"""
-        self.supplier_page.refresh()
-        self.stack.setCurrentWidget(self.supplier_page)
-        self.status.showMessage("🏭 Beszállítók kezelése")
+        page = self.get_page("suppliers")
+        self.refresh_page("suppliers", page)
+        self.stack.setCurrentWidget(page)
+        self.status.showMessage(STATUS_SUPPLIERS)
     
     def refresh_current(self):
         """Refresh current page"""
         current_widget = self.stack.currentWidget()
         if hasattr(current_widget, 'refresh'):
             current_widget.refresh()
-            self.status.showMessage("🔄 Lista frissítve")
+            self.status.showMessage(STATUS_REFRESHED)
     
     def go_back(self):
         """Go back to invoice list or clear selection"""
@@ -535,28 +698,29 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
             # Clear selection if on main page
             if hasattr(current_widget, 'table'):
                 current_widget.table.clearSelection()
-                self.status.showMessage("✨ Kijelölés törölve")
+                self.status.showMessage(STATUS_SELECTION_CLEARED)
         else:
             # Go back to invoice list from other pages
             self.show_list()
     
     # New item methods
+    def insert_record(self, table, data):
+        """Insert a record from dialog data using the table's INSERT statement"""
+        with get_db() as conn:
+            conn.execute(INSERT_STATEMENTS[table], data)
+    
     def new_invoice(self):
         """Create new invoice"""
         dialog = InvoiceFormDialog(parent=self)
         if dialog.exec_() == QDialog.Accepted:
             try:
                 data = dialog.get_data()
-                with get_db() as conn:
-                    conn.execute("""
-                        INSERT INTO invoice (number, direction, partner_id, created_utc)
-                        VALUES (?, ?, ?, ?)
-                    """, (data['number'], data['direction'], data['partner_id'], int(time.time())))
-                    conn.commit()
+                data['created_utc'] = int(time.time())
+                self.insert_record("invoice", data)
+                self._dirty["list"] = True
                 
-                # Switch to invoice list and refresh
+                # Switch to invoice list (show_list refreshes it)
                 self.show_list()
-                self.list_page.refresh()
                 self.status.showMessage(f"✅ Számla '{data['number']}' létrehozva!", 3000)
             except Exception as e:
                 QMessageBox.critical(self, "Hiba", f"Számla létrehozása sikertelen: {str(e)}")
@@ -567,16 +731,13 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
         if dialog.exec_() == QDialog.Accepted:
             try:
                 data = dialog.get_data()
-                with get_db() as conn:
-                    conn.execute("""
-                        INSERT INTO product (sku, name, unit_price_cents, vat_rate)
-                        VALUES (?, ?, ?, ?)
-                    """, (data['sku'], data['name'], data['unit_price_cents'], data['vat_rate']))
-                    conn.commit()
+                self.insert_record("product", data)
+                invalidate_products_cache()
                 
                 # Refresh product page if visible
-                if self.stack.currentWidget() == self.product_page:
-                    self.product_page.refresh()
+                self._dirty["products"] = True
+                if self.stack.currentWidget() is self._pages["products"]:
+                    self.refresh_page("products", self._pages["products"])
                 
                 self.status.showMessage("✅ Új termék hozzáadva")
                 QMessageBox.information(self, "Siker", "Termék sikeresen hozzáadva!")
@@ -587,20 +748,17 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
     
     def new_customer(self):
         """Create new customer"""
-        dialog = PartnerFormDialog(partner_type="customer", parent=self)
+        dialog = PartnerFormDialog.get_instance(partner_type="customer", parent=self)
         if dialog.exec_() == QDialog.Accepted:
             try:
                 data = dialog.get_data()
-                with get_db() as conn:
-                    conn.execute("""
-                        INSERT INTO partner (name, kind, tax_id, address)
-                        VALUES (?, ?, ?, ?)
-                    """, (data['name'], data['kind'], data['tax_id'], data['address']))
-                    conn.commit()
+                self.insert_record("partner", data)
+                invalidate_partners_cache()
                 
                 # Refresh customer page if visible
-                if self.stack.currentWidget() == self.customer_page:
-                    self.customer_page.refresh()
+                self._dirty["customers"] = True
+                if self.stack.currentWidget() is self._pages["customers"]:
+                    self.refresh_page("customers", self._pages["customers"])
                 
                 self.status.showMessage("✅ Új vevő hozzáadva")
                 QMessageBox.information(self, "Siker", "Vevő sikeresen hozzáadva!")
@@ -609,20 +767,17 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
     
     def new_supplier(self):
         """Create new supplier"""
-        dialog = PartnerFormDialog(partner_type="supplier", parent=self)
+        dialog = PartnerFormDialog.get_instance(partner_type="supplier", parent=self)
         if dialog.exec_() == QDialog.Accepted:
             try:
                 data = dialog.get_data()
-                with get_db() as conn:
-                    conn.execute("""
-                        INSERT INTO partner (name, kind, tax_id, address)
-                        VALUES (?, ?, ?, ?)
-                    """, (data['name'], data['kind'], data['tax_id'], data['address']))
-                    conn.commit()
+                self.insert_record("partner", data)
+                invalidate_partners_cache()
                 
                 # Refresh supplier page if visible
-                if self.stack.currentWidget() == self.supplier_page:
-                    self.supplier_page.refresh()
+                self._dirty["suppliers"] = True
+                if self.stack.currentWidget() is self._pages["suppliers"]:
+                    self.refresh_page("suppliers", self._pages["suppliers"])
                 
                 self.status.showMessage("✅ Új beszállító hozzáadva")
                 QMessageBox.information(self, "Siker", "Beszállító sikeresen hozzáadva!")
@@ -631,66 +786,11 @@ class MainWindow(QMainWindow, MenuNavigationMixin):
     
     def show_shortcuts(self):
         """Show enhanced keyboard shortcuts help"""
-        shortcuts_text = """
-<h2>🎹 Billentyűparancsok</h2>
-
-<h3>📋 Általános navigáció:</h3>
-<table style='font-family: monospace; margin: 10px;'>
-<tr><td><b>F1</b></td><td>Súgó megjelenítése</td></tr>
-<tr><td><b>F2</b></td><td>Számlák listája</td></tr>
-<tr><td><b>F3</b></td><td>Termékek kezelése</td></tr>
-<tr><td><b>F4</b></td><td>Vevők kezelése</td></tr>
-<tr><td><b>F5</b></td><td>Lista frissítése</td></tr>
-<tr><td><b>F6</b></td><td>Beszállítók kezelése</td></tr>
-<tr><td><b>Escape</b></td><td>Visszalépés / Kijelölés törlése</td></tr>
-</table>
-
-<h3>📝 Műveletek:</h3>
-<table style='font-family: monospace; margin: 10px;'>
-<tr><td><b>Enter</b></td><td>Kiválasztott elem szerkesztése</td></tr>
-<tr><td><b>Delete</b></td><td>Kiválasztott elem törlése</td></tr>
-<tr><td><b>Insert</b></td><td>Új elem hozzáadása</td></tr>
-<tr><td><b>↑↓</b></td><td>Navigáció a listában</td></tr>
-</table>
-
-<h3>⚡ Gyorsbillentyűk:</h3>
-<table style='font-family: monospace; margin: 10px;'>
-<tr><td><b>Ctrl+N</b></td><td>Új számla</td></tr>
-<tr><td><b>Ctrl+Shift+P</b></td><td>Új termék</td></tr>
-<tr><td><b>Ctrl+Shift+C</b></td><td>Új vevő</td></tr>
-<tr><td><b>Ctrl+Shift+S</b></td><td>Új beszállító</td></tr>
-<tr><td><b>Ctrl+Q</b></td><td>Kilépés</td></tr>
-</table>
-
-<h3>🧭 Menü navigáció:</h3>
-<table style='font-family: monospace; margin: 10px;'>
-<tr><td><b>Alt + ←→</b></td><td>Menük közötti navigáció</td></tr>
-<tr><td><b>Alt + betű</b></td><td>Menü aktiválása</td></tr>
-</table>
-
-<p><i>💡 Minden funkció elérhető billentyűzetről!</i></p>
-        """
-        
-        QMessageBox.information(self, "🎹 Billentyűparancsok", shortcuts_text)
+        QMessageBox.information(self, "🎹 Billentyűparancsok", SHORTCUTS_HTML)
     
     def about(self):
         """Show about dialog"""
-        QMessageBox.about(self, "📄 Számlázó Rendszer v2.1", 
-                         "🎯 <b>Számlázó Rendszer v2.1</b><br><br>"
-                         "🚀 <b>Management Edition</b><br><br>"
-                         "✨ <b>Jellemzők:</b><br>"
-                         "• 🎹 Teljes billentyűzet navigáció<br>"
-                         "• 🛍️ Termékek kezelése<br>"
-                         "• 👥 Vevők kezelése<br>"
-                         "• 🏭 Beszállítók kezelése<br>"
-                         "• 🧭 Menü navigáció nyilakkal<br>"
-                         "• 🗄️ SQLite adatbázis<br>"
-                         "• 📊 Számla kezelés<br>"
-                         "• 🔧 Javított hibakezelés<br>"
-                         "• 🎨 Professzionális megjelenés<br><br>"
-                         "🔧 <b>Technológia:</b> PyQt5, SQLite<br>"
-                         "📅 <b>Verzió:</b> 2.1.0<br>"
-                         "© 2024 - Management Edition")
+        QMessageBox.about(self, "📄 Számlázó Rendszer v2.1", ABOUT_HTML)
 
 
 def main():
@@ -701,41 +801,7 @@ def main():
     app.setOrganizationName("Professional Software")
     
     # Apply basic styling
-    app.setStyleSheet("""
-        QMainWindow {
-            background-color: #f8f9fa;
-        }
-        QWidget {
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 11pt;
-        }
-        QPushButton {
-            background-color: #007bff;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #0056b3;
-        }
-        QPushButton:pressed {
-            background-color: #004085;
-        }
-        QMenuBar {
-            background-color: #343a40;
-            color: white;
-            font-weight: bold;
-        }
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 8px 12px;
-        }
-        QMenuBar::item:selected {
-            background-color: #007bff;
-        }
-    """)
+    app.setStyleSheet(APP_STYLESHEET)
     
     try:
         window = MainWindow()
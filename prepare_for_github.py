@@ -4,10 +4,40 @@ Project Cleanup Script for GitHub Publication
 Organizes the invoice manager project for public release
 """
 
+import errno
+import os
 import shutil
 from pathlib import Path
 import json
 
+def move_path(src, dst):
+    """Move src to dst with a rename, copying only across file systems"""
+    if os.path.isdir(src):
+        # shutil.move() also renames, but moves src into an existing dst
+        # directory where os.replace() fails with "Directory not empty"
+        shutil.move(src, dst)
+        return
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # copyfile() uses the platform's fast copy (sendfile, fcopyfile
+        # or CopyFile2) instead of shutil.move()'s generic fallback
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+        os.unlink(src)
+
+def remove_tree(path):
+    """Delete a directory tree using the entry types scandir already read"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
 def cleanup_for_github():
     """Clean up and organize the project for GitHub publication"""
     project_root = Path(__file__).parent
@@ -20,9 +50,12 @@ def cleanup_for_github():
     tests_dir = project_root / "tests"
     archive_dir = project_root / "archive"
     
-    docs_dir.mkdir(exist_ok=True)
-    tests_dir.mkdir(exist_ok=True)
-    archive_dir.mkdir(exist_ok=True)
+    for directory in (docs_dir, tests_dir, archive_dir):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            if not os.path.isdir(directory):
+                raise
     
     # Documentation files to move to docs/
     docs_files = {
@@ -55,44 +88,43 @@ def cleanup_for_github():
         "fix_db_schema.py", "vat_summary_complete.py", "cleanup_project.py"
     }
     
-    # Move documentation files
-    print("\n📚 Moving documentation files...")
+    # Plan every move against a single directory listing, so candidates
+    # that are not present cost no extra stat() calls
+    entries = {entry.name: entry for entry in os.scandir(project_root)}
+    plan = []
     for old_name, new_name in docs_files.items():
-        old_path = project_root / old_name
-        new_path = docs_dir / new_name
-        if old_path.exists():
-            shutil.move(str(old_path), str(new_path))
-            print(f"  ✅ {old_name} → docs/{new_name}")
-    
-    # Move test files
-    print("\n🧪 Moving test files...")
+        plan.append((old_name, docs_dir / new_name,
+                     f"  ✅ {old_name} → docs/{new_name}"))
     for old_name, new_name in test_files.items():
-        old_path = project_root / old_name
-        new_path = tests_dir / new_name
-        if old_path.exists():
-            shutil.move(str(old_path), str(new_path))
-            print(f"  ✅ {old_name} → tests/{new_name}")
+        plan.append((old_name, tests_dir / new_name,
+                     f"  ✅ {old_name} → tests/{new_name}"))
+    # Only archive candidates that are present in the listing
+    for filename in sorted(archive_files & entries.keys()):
+        plan.append((filename, archive_dir / filename,
+                     f"  📦 {filename} → archive/{filename}"))
+    plan.append(("backup", archive_dir / "backup",
+                 "  📦 backup/ → archive/backup/"))
     
-    # Archive development files
-    print("\n📦 Archiving development files...")
-    for filename in archive_files:
-        old_path = project_root / filename
-        new_path = archive_dir / filename
-        if old_path.exists():
-            shutil.move(str(old_path), str(new_path))
-            print(f"  📦 {filename} → archive/{filename}")
-    
-    # Move backup directory to archive
-    backup_dir = project_root / "backup"
-    if backup_dir.exists():
-        archive_backup = archive_dir / "backup"
-        shutil.move(str(backup_dir), str(archive_backup))
-        print(f"  📦 backup/ → archive/backup/")
+    # Move documentation, test and development files
+    print("\n📦 Moving documentation, test and development files...")
+    moves = [(entries[old_name].path, new_path, message)
+             for old_name, new_path, message in plan
+             if old_name in entries]
+    done = []
+    try:
+        for src, dst, message in moves:
+            move_path(src, dst)
+            done.append(message)
+    finally:
+        # Report the completed moves with a single write, even when a
+        # later move failed
+        if done:
+            print("\n".join(done))
     
     # Clean up Python cache
-    pycache_dir = project_root / "__pycache__"
-    if pycache_dir.exists():
-        shutil.rmtree(pycache_dir)
+    pycache_entry = entries.get("__pycache__")
+    if pycache_entry is not None and pycache_entry.is_dir():
+        remove_tree(pycache_entry.path)
         print(f"  🗑️ Removed __pycache__/")
     
     # Create requirements.txt if it doesn't exist
@@ -139,8 +171,7 @@ def create_requirements_file(filepath):
     requirements = """# Professional Invoice Manager Requirements
 PyQt5>=5.15.0
 """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(requirements)
+    filepath.write_text(requirements, encoding='utf-8')
     print(f"  ✅ Created {filepath.name}")
 
 def create_gitignore_file(filepath):
@@ -235,8 +266,7 @@ logs/
 *.temp
 *.log
 """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(gitignore_content)
+    filepath.write_text(gitignore_content, encoding='utf-8')
     print(f"  ✅ Created {filepath.name}")
 
 def create_license_file(filepath):
@@ -263,8 +293,7 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(license_content)
+    filepath.write_text(license_content, encoding='utf-8')
     print(f"  ✅ Created {filepath.name}")
 
 def update_readme_for_github(filepath):
@@ -335,8 +364,7 @@ def clean_config_for_release(filepath):
     """Clean config.json for public release"""
     if filepath.exists():
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = json.loads(filepath.read_bytes())
             
             # Clean sensitive data
             if 'business' in config_data:
@@ -348,8 +376,12 @@ def clean_config_for_release(filepath):
             if 'database' in config_data:
                 config_data['database']['path'] = "invoice_qt5.db"
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
+            # Encode in one pass and write once; json.dump() issues a
+            # separate write() for every indented fragment
+            filepath.write_text(
+                json.dumps(config_data, indent=4, ensure_ascii=False),
+                encoding='utf-8'
+            )
             print(f"  ✅ Cleaned config.json for public release")
             
         except Exception as e:
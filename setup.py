@@ -11,8 +11,11 @@ this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text(encoding='utf-8')
 
 # Read requirements
-requirements = (this_directory / "requirements.txt").read_text().strip().split('\n')
-requirements = [req.strip() for req in requirements if req.strip() and not req.startswith('#')]
+with open(this_directory / "requirements.txt", encoding='utf-8') as f:
+    requirements = [
+        req for req in (line.strip() for line in f)
+        if req and not req.startswith('#')
+    ]
 
 setup(
     name="professional-invoice-manager",
@@ -23,7 +26,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/professional-invoice-manager",
-    packages=find_packages(),
+    package_dir={"": "src"},
+    packages=find_packages(where="src"),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: End Users/Desktop",
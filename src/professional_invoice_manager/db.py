@@ -1,11 +1,99 @@
 """Database utilities for Professional Invoice Manager."""
 
+import atexit
 import sqlite3
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
 
 from professional_invoice_manager.config import config
 
 
+# Shared connections handed out by get_db() and get_readonly_conn(). A
+# sqlite3 connection may only be used by its own thread, so each thread
+# keeps its own ``{(database path, read-only flag): connection}`` dict,
+# which is released together with the thread.
+_local = threading.local()
+
+# Per-connection settings applied once when a connection is opened.
+# WAL lets readers proceed while a write commits and, with
+# synchronous=NORMAL, syncs only at checkpoints instead of every commit.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON;",
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-8000;",
+    "PRAGMA mmap_size=268435456;",
+)
+
+# Stored in PRAGMA user_version once the schema and seed data are in
+# place; bump it whenever init_database() changes the schema.
+_SCHEMA_VERSION = 2
+
+# Seed rows, and the statements inserting them, for an empty database
+_INSERT_PRODUCT_SQL = (
+    "INSERT INTO product(sku,name,unit_price_cents,vat_rate) VALUES(?,?,?,?)"
+)
+_INSERT_PARTNER_SQL = (
+    "INSERT INTO partner(name,kind,tax_id,address) VALUES(?,?,?,?)"
+)
+_SEED_PRODUCTS = (
+    ("SKU001", "Kenyér 1kg", 69900, 5),
+    ("SKU002", "Tej 1l", 39900, 18),
+    ("SKU003", "Kolbász 1kg", 299900, 27),
+    ("SKU004", "Kakaóscsiga", 34900, 27),
+    ("SKU005", "Rostos üdítő 1l", 59900, 27),
+)
+_SEED_PARTNERS = (
+    ("Lakossági Vevő", "customer", None, None),
+    ("Teszt Kft.", "customer", "12345678-1-42", "1111 Bp, Fő u. 1."),
+    (
+        "Minta Beszállító Zrt.",
+        "supplier",
+        "87654321-2-13",
+        "7626 Pécs, Utca 2.",
+    ),
+)
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the application's connection pragmas to ``conn``."""
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _is_configured(conn: sqlite3.Connection) -> bool:
+    """Return whether the connection pragmas were already applied to ``conn``.
+
+    ``foreign_keys`` is off on a fresh connection and is the first pragma
+    :func:`_configure_connection` turns on, so reading it back is enough.
+    """
+    return bool(conn.execute("PRAGMA foreign_keys").fetchone()[0])
+
+
+def _thread_connections() -> Dict[Tuple[str, bool], sqlite3.Connection]:
+    """Return the calling thread's shared connections."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    return connections
+
+
+def _shared_connection(readonly: bool) -> sqlite3.Connection:
+    """Return the calling thread's shared connection, opening it once."""
+    db_path = config.get("database.path", "invoice_qt5.db")
+    connections = _thread_connections()
+    conn = connections.get((db_path, readonly))
+    if conn is None:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        _configure_connection(conn)
+        if readonly:
+            conn.execute("PRAGMA query_only=ON;")
+        connections[db_path, readonly] = conn
+    return conn
+
+
 def get_db(
     connection: Optional[sqlite3.Connection] = None,
 ) -> sqlite3.Connection:
@@ -16,112 +104,158 @@ def get_db(
     connection:
         Optional existing :class:`sqlite3.Connection` to reuse. When provided,
         it is returned after ensuring the ``row_factory`` is set to
-        :class:`sqlite3.Row`. If ``None`` (default), a new connection is opened
-        using the configured database path.
+        :class:`sqlite3.Row`. If ``None`` (default), the calling thread's
+        shared connection for the configured database path is returned,
+        opening it on first use. The shared connection stays open so its
+        page and statement caches survive between calls; release it with
+        :func:`close_db` instead of closing it directly. It runs in
+        autocommit mode, so every statement commits on its own; group
+        related writes with :func:`transaction`.
+    """
+    conn = _shared_connection(False) if connection is None else connection
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def get_readonly_conn() -> sqlite3.Connection:
+    """Return the calling thread's shared read-only connection.
+
+    The connection is opened once with ``query_only`` set, so lookups
+    such as the dialogs' choice lists cannot write by accident. A
+    ``:memory:`` database cannot be opened twice, so its regular shared
+    connection from :func:`get_db` is returned instead.
     """
-    if connection is None:
-        db_path = config.get("database.path", "invoice_qt5.db")
-        conn = sqlite3.connect(db_path)
-    else:
-        conn = connection
+    if config.get("database.path", "invoice_qt5.db") == ":memory:":
+        return get_db()
+    conn = _shared_connection(True)
     conn.row_factory = sqlite3.Row
     return conn
 
 
+def close_db() -> None:
+    """Close the shared connections opened in this thread.
+
+    Registered with :mod:`atexit`, so the main thread's connections are
+    also closed when the interpreter exits. A worker thread that ends
+    without calling it drops its connections along with its
+    thread-local storage.
+    """
+    connections = _thread_connections()
+    while connections:
+        connections.popitem()[1].close()
+
+
+atexit.register(close_db)
+
+
+@contextmanager
+def transaction(
+    connection: Optional[sqlite3.Connection] = None,
+    immediate: bool = False,
+) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements in one explicit transaction.
+
+    The transaction is committed when the block exits normally and rolled
+    back if it raises, so related writes share a single commit.
+
+    Parameters
+    ----------
+    connection:
+        Optional :class:`sqlite3.Connection` to use. When ``None``
+        (default), the shared connection from :func:`get_db` is used.
+    immediate:
+        Start with ``BEGIN IMMEDIATE`` to take the write lock up front
+        instead of upgrading a read lock on the first write.
+    """
+    conn = get_db(connection)
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
 def init_database(
     connection: Optional[sqlite3.Connection] = None,
 ) -> None:
     """Initialize database schema and seed data.
 
+    A database whose ``user_version`` is already at or above the current
+    schema version is left untouched, so the schema script and seed checks
+    run only on the first start after a schema change and a database
+    written by a newer release is never downgraded.
+
     Parameters
     ----------
     connection:
         Optional :class:`sqlite3.Connection` to initialize. If provided, the
         schema and seed records are applied to this connection and it remains
-        open for the caller to manage. When ``None`` (default), a
-        temporary connection is created via :func:`get_db` and closed
-        after initialization.
+        open for the caller to manage; the connection pragmas are applied
+        to it only on its first initialization. When ``None`` (default),
+        the shared connection from :func:`get_db` is used, which already
+        has the connection pragmas applied.
     """
-    should_close = connection is None
+    if connection is not None and not _is_configured(connection):
+        _configure_connection(connection)
     conn = get_db(connection)
-    try:
-        conn.execute("PRAGMA foreign_keys=ON;")
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
-        conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS partner (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                kind TEXT NOT NULL CHECK(kind IN ('customer','supplier')),
-                tax_id TEXT,
-                address TEXT
-            );
-            CREATE TABLE IF NOT EXISTS product (
-                id INTEGER PRIMARY KEY,
-                sku TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                unit_price_cents INTEGER NOT NULL,
-                vat_rate INTEGER NOT NULL DEFAULT 27
-            );
-            CREATE TABLE IF NOT EXISTS invoice (
-                id INTEGER PRIMARY KEY,
-                number TEXT NOT NULL UNIQUE,
-                partner_id INTEGER NOT NULL REFERENCES partner(id),
-                direction TEXT NOT NULL
-                    CHECK(direction IN ('sale','purchase')),
-                created_utc INTEGER NOT NULL,
-                notes TEXT
-            );
-            CREATE TABLE IF NOT EXISTS invoice_item (
-                id INTEGER PRIMARY KEY,
-                invoice_id INTEGER NOT NULL REFERENCES invoice(id)
-                    ON DELETE CASCADE,
-                product_id INTEGER NOT NULL REFERENCES product(id),
-                description TEXT,
-                qty INTEGER NOT NULL,
-                unit_price_cents INTEGER NOT NULL,
-                vat_rate INTEGER NOT NULL
-            );
-            """
-        )
-
-        if conn.execute("SELECT COUNT(*) FROM product").fetchone()[0] == 0:
-            products = [
-                ("SKU001", "Kenyér 1kg", 69900, 5),
-                ("SKU002", "Tej 1l", 39900, 18),
-                ("SKU003", "Kolbász 1kg", 299900, 27),
-                ("SKU004", "Kakaóscsiga", 34900, 27),
-                ("SKU005", "Rostos üdítő 1l", 59900, 27),
-            ]
-            conn.executemany(
-                "INSERT INTO product(sku,name,unit_price_cents,vat_rate) "
-                "VALUES(?,?,?,?)",
-                products,
-            )
-
-        if conn.execute("SELECT COUNT(*) FROM partner").fetchone()[0] == 0:
-            partners = [
-                ("Lakossági Vevő", "customer", None, None),
-                (
-                    "Teszt Kft.",
-                    "customer",
-                    "12345678-1-42",
-                    "1111 Bp, Fő u. 1.",
-                ),
-                (
-                    "Minta Beszállító Zrt.",
-                    "supplier",
-                    "87654321-2-13",
-                    "7626 Pécs, Utca 2.",
-                ),
-            ]
-            conn.executemany(
-                "INSERT INTO partner(name,kind,tax_id,address) "
-                "VALUES(?,?,?,?)",
-                partners,
-            )
-        conn.commit()
-    finally:
-        if should_close:
-            conn.close()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+        return
+
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS partner (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK(kind IN ('customer','supplier')),
+            tax_id TEXT,
+            address TEXT
+        );
+        CREATE TABLE IF NOT EXISTS product (
+            id INTEGER PRIMARY KEY,
+            sku TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            unit_price_cents INTEGER NOT NULL,
+            vat_rate INTEGER NOT NULL DEFAULT 27
+        );
+        CREATE TABLE IF NOT EXISTS invoice (
+            id INTEGER PRIMARY KEY,
+            number TEXT NOT NULL UNIQUE,
+            partner_id INTEGER NOT NULL REFERENCES partner(id),
+            direction TEXT NOT NULL
+                CHECK(direction IN ('sale','purchase')),
+            created_utc INTEGER NOT NULL,
+            notes TEXT
+        );
+        CREATE TABLE IF NOT EXISTS invoice_item (
+            id INTEGER PRIMARY KEY,
+            invoice_id INTEGER NOT NULL REFERENCES invoice(id)
+                ON DELETE CASCADE,
+            product_id INTEGER NOT NULL REFERENCES product(id),
+            description TEXT,
+            qty INTEGER NOT NULL,
+            unit_price_cents INTEGER NOT NULL,
+            vat_rate INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_partner_name
+            ON partner(name, id);
+        CREATE INDEX IF NOT EXISTS idx_invoice_item_invoice
+            ON invoice_item(invoice_id, id);
+        """
+    )
+
+    # EXISTS stops at the first row instead of counting the whole table
+    has_products, has_partners = conn.execute(
+        "SELECT EXISTS(SELECT 1 FROM product), "
+        "EXISTS(SELECT 1 FROM partner)"
+    ).fetchone()
+
+    # The seed batches and the schema version share one explicit
+    # transaction and one commit
+    with transaction(conn):
+        if not has_products:
+            conn.executemany(_INSERT_PRODUCT_SQL, _SEED_PRODUCTS)
+        if not has_partners:
+            conn.executemany(_INSERT_PARTNER_SQL, _SEED_PARTNERS)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
@@ -3,73 +3,132 @@
 import logging
 import sqlite3
 
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
     QComboBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
-    QHBoxLayout,
-    QLabel,
     QLineEdit,
     QMessageBox,
     QSpinBox,
     QVBoxLayout,
 )
 
-from professional_invoice_manager.db import get_db
+from professional_invoice_manager.db import get_readonly_conn
+
+# Partner names, ids and combo index by id offered by InvoiceFormDialog,
+# loaded on first use
+_partners_cache = None
+
+
+def invalidate_partners_cache():
+    """Drop cached partners after partners are added or changed."""
+    global _partners_cache
+    _partners_cache = None
+
+
+def _parse_price_cents(text):
+    """Parse a decimal price such as ``"1500"`` or ``"27.47"`` into cents.
+
+    Digits past the second decimal place are dropped. Raises
+    :class:`ValueError` for text that is not a plain decimal number.
+    """
+    number = text.strip()
+    negative = number.startswith("-")
+    if negative:
+        number = number[1:]
+    whole, _, fraction = number.partition(".")
+    for part in (whole, fraction):
+        # int() alone would also take a second sign, spaces, underscores
+        # and non-ASCII digits
+        if part and not (part.isascii() and part.isdigit()):
+            raise ValueError(f"invalid price: {text!r}")
+    cents = int(whole or "0") * 100 + int((fraction + "00")[:2])
+    return -cents if negative else cents
 
 
 class PartnerFormDialog(QDialog):
     """Partner (customer/supplier) management dialog."""
 
+    # Dialog reused by get_instance() across opens
+    _instance = None
+
+    # partner_data keys, in the order of the edits in self._edits
+    _FIELD_KEYS = ('name', 'tax_id', 'address')
+
+    # Window titles keyed by (partner type, editing existing partner)
+    _TITLES = {
+        ("customer", False): "👤 Vevő hozzáadása",
+        ("customer", True): "👤 Vevő szerkesztése",
+        ("supplier", False): "👤 Beszállító hozzáadása",
+        ("supplier", True): "👤 Beszállító szerkesztése",
+    }
+
     def __init__(
         self, partner_data=None, partner_type="customer", parent=None
     ):
         super().__init__(parent)
-        self.partner_data = partner_data
-        self.partner_type = partner_type
-
-        type_text = "Vevő" if partner_type == "customer" else "Beszállító"
-        title_suffix = " szerkesztése" if partner_data else " hozzáadása"
-        self.setWindowTitle(f"👤 {type_text}{title_suffix}")
         self.setModal(True)
         self.resize(500, 400)
         self.setup_ui()
+        self.reset(partner_data, partner_type)
+
+    @classmethod
+    def get_instance(
+        cls, partner_data=None, partner_type="customer", parent=None
+    ):
+        """Return the shared dialog, reset for the given partner.
+
+        The widgets are built once per parent window and reused for later
+        opens instead of being constructed again.
+        """
+        dialog = cls._instance
+        if (
+            dialog is None
+            or sip.isdeleted(dialog)
+            or dialog.parent() is not parent
+        ):
+            dialog = cls._instance = cls(partner_data, partner_type, parent)
+        else:
+            dialog.reset(partner_data, partner_type)
+        return dialog
+
+    def reset(self, partner_data=None, partner_type="customer"):
+        """Clear the form and prepare it for the given partner."""
+        self.partner_data = partner_data
+        self.partner_type = partner_type
+
+        kind = "customer" if partner_type == "customer" else "supplier"
+        self.setWindowTitle(self._TITLES[kind, bool(partner_data)])
 
+        for edit in self._edits:
+            edit.clear()
         if partner_data:
             self.load_data()
+        self.name_edit.setFocus()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
 
-        # Form layout
-        form_layout = QVBoxLayout()
+        form = QFormLayout()
 
-        # Name
-        name_layout = QHBoxLayout()
-        name_layout.addWidget(QLabel("🏢 Név:"))
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Partner neve")
-        name_layout.addWidget(self.name_edit)
-        form_layout.addLayout(name_layout)
+        form.addRow("🏢 Név:", self.name_edit)
 
-        # Tax ID
-        tax_layout = QHBoxLayout()
-        tax_layout.addWidget(QLabel("🆔 Adószám:"))
         self.tax_edit = QLineEdit()
         self.tax_edit.setPlaceholderText("12345678-1-42")
-        tax_layout.addWidget(self.tax_edit)
-        form_layout.addLayout(tax_layout)
+        form.addRow("🆔 Adószám:", self.tax_edit)
 
-        # Address
-        addr_layout = QVBoxLayout()
-        addr_layout.addWidget(QLabel("🏠 Cím:"))
         self.address_edit = QLineEdit()
         self.address_edit.setPlaceholderText("1111 Budapest, Példa utca 1.")
-        addr_layout.addWidget(self.address_edit)
-        form_layout.addLayout(addr_layout)
+        form.addRow("🏠 Cím:", self.address_edit)
 
-        layout.addLayout(form_layout)
+        layout.addLayout(form)
+        self._edits = (self.name_edit, self.tax_edit, self.address_edit)
 
         # Buttons
         buttons = QDialogButtonBox(
@@ -79,25 +138,22 @@ class PartnerFormDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
-        # Set focus
-        self.name_edit.setFocus()
-
     def load_data(self):
         """Load existing partner data."""
         if self.partner_data:
-            self.name_edit.setText(self.partner_data.get('name', ''))
-            self.tax_edit.setText(self.partner_data.get('tax_id', '') or '')
-            self.address_edit.setText(
-                self.partner_data.get('address', '') or ''
-            )
+            for key, edit in zip(self._FIELD_KEYS, self._edits):
+                edit.setText(self.partner_data.get(key) or '')
 
     def get_data(self):
         """Get form data."""
+        name, tax_id, address = (
+            edit.text().strip() for edit in self._edits
+        )
         return {
-            'name': self.name_edit.text().strip(),
+            'name': name,
             'kind': self.partner_type,
-            'tax_id': self.tax_edit.text().strip() or None,
-            'address': self.address_edit.text().strip() or None,
+            'tax_id': tax_id or None,
+            'address': address or None,
         }
 
     def accept(self):
@@ -115,13 +171,16 @@ class PartnerFormDialog(QDialog):
 class InvoiceFormDialog(QDialog):
     """Invoice creation/editing dialog"""
 
+    # Window titles keyed by whether an existing invoice is edited
+    _TITLES = {False: "🧾 Számla létrehozása", True: "🧾 Számla szerkesztése"}
+
     def __init__(self, invoice_data=None, parent=None):
         super().__init__(parent)
         self.invoice_data = invoice_data
-        title = "🧾 Számla" + (
-            " szerkesztése" if invoice_data else " létrehozása"
-        )
-        self.setWindowTitle(title)
+        self.setWindowTitle(self._TITLES[bool(invoice_data)])
+        self._partners_loaded = False
+        self._partner_index = {}
+        self._pending_partner_id = None
         self.setup_ui()
         if invoice_data:
             self.load_data()
@@ -134,7 +193,11 @@ class InvoiceFormDialog(QDialog):
         form.addRow("📋 Számlaszám:", self.number_edit)
 
         self.partner_combo = QComboBox()
-        self.load_partners()
+        if _partners_cache is None:
+            # Query after the dialog has painted instead of blocking it
+            QTimer.singleShot(0, self.load_partners)
+        else:
+            self.load_partners()
         form.addRow("👤 Partner:", self.partner_combo)
 
         layout.addLayout(form)
@@ -147,29 +210,59 @@ class InvoiceFormDialog(QDialog):
         layout.addWidget(buttons)
 
     def load_partners(self):
-        try:
-            with get_db() as conn:
-                rows = conn.execute(
-                    "SELECT id, name FROM partner ORDER BY name"
+        global _partners_cache
+        if _partners_cache is None:
+            try:
+                rows = get_readonly_conn().execute(
+                    "SELECT name, id FROM partner ORDER BY name"
                 ).fetchall()
-                for row in rows:
-                    self.partner_combo.addItem(row["name"], row["id"])
-        except sqlite3.Error:
-            logging.exception("Failed to load partners")
-            QMessageBox.warning(
-                self,
-                "Hiba",
-                "Nem sikerült betölteni a partnereket.",
+            except sqlite3.Error:
+                logging.exception("Failed to load partners")
+                QMessageBox.warning(
+                    self,
+                    "Hiba",
+                    "Nem sikerült betölteni a partnereket.",
+                )
+                self.partner_combo.clear()
+                return
+            # Unpack rows positionally instead of by column name
+            ids = [partner_id for _, partner_id in rows]
+            _partners_cache = (
+                [name for name, _ in rows],
+                ids,
+                {partner_id: index for index, partner_id in enumerate(ids)},
             )
-            self.partner_combo.clear()
+
+        # Fill a detached model, then swap it in with a single reset
+        names, ids, self._partner_index = _partners_cache
+        combo = self.partner_combo
+        model = QStandardItemModel(len(names), 1, combo)
+        for row, (name, partner_id) in enumerate(zip(names, ids)):
+            item = QStandardItem(name)
+            item.setData(partner_id, Qt.UserRole)
+            model.setItem(row, item)
+        combo.blockSignals(True)
+        combo.setModel(model)
+        combo.blockSignals(False)
+        self._partners_loaded = True
+        if self._pending_partner_id is not None:
+            self.select_partner(self._pending_partner_id)
+            self._pending_partner_id = None
 
     def load_data(self):
         self.number_edit.setText(self.invoice_data.get("number", ""))
         partner_id = self.invoice_data.get("partner_id")
-        if partner_id is not None:
-            index = self.partner_combo.findData(partner_id)
-            if index >= 0:
-                self.partner_combo.setCurrentIndex(index)
+        if partner_id is None:
+            return
+        if self._partners_loaded:
+            self.select_partner(partner_id)
+        else:
+            self._pending_partner_id = partner_id
+
+    def select_partner(self, partner_id):
+        index = self._partner_index.get(partner_id, -1)
+        if index >= 0:
+            self.partner_combo.setCurrentIndex(index)
 
     def get_data(self):
         return {
@@ -192,13 +285,13 @@ class InvoiceFormDialog(QDialog):
 class ProductFormDialog(QDialog):
     """Product management dialog"""
 
+    # Window titles keyed by whether an existing product is edited
+    _TITLES = {False: "🛍️ Termék hozzáadása", True: "🛍️ Termék szerkesztése"}
+
     def __init__(self, product_data=None, parent=None):
         super().__init__(parent)
         self.product_data = product_data
-        title = "🛍️ Termék" + (
-            " szerkesztése" if product_data else " hozzáadása"
-        )
-        self.setWindowTitle(title)
+        self.setWindowTitle(self._TITLES[bool(product_data)])
         self.setup_ui()
         if product_data:
             self.load_data()
@@ -238,7 +331,7 @@ class ProductFormDialog(QDialog):
 
     def get_data(self):
         try:
-            price_cents = int(float(self.price_edit.text()) * 100)
+            price_cents = _parse_price_cents(self.price_edit.text())
         except ValueError:
             price_cents = 0
         return {
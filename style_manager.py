@@ -2,8 +2,9 @@
 Style manager for loading and applying CSS styles
 """
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from PyQt5.QtWidgets import QApplication
 
 
@@ -14,6 +15,8 @@ class StyleManager:
         self.styles_dir = Path(styles_dir)
         self.current_theme = "default"
         self._loaded_styles = {}
+        # ((main.css mtime_ns, dialogs.css mtime_ns), combined sheet)
+        self._combined_cache: Optional[Tuple[tuple, str]] = None
     
     def load_style_file(self, filename: str) -> str:
         """Load CSS content from file"""
@@ -21,16 +24,15 @@ class StyleManager:
             return self._loaded_styles[filename]
         
         style_path = self.styles_dir / filename
-        if style_path.exists():
-            try:
-                with open(style_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self._loaded_styles[filename] = content
-                    return content
-            except IOError as e:
-                print(f"Warning: Could not load style file {filename}: {e}")
-        else:
+        try:
+            content = style_path.read_bytes().decode('utf-8')
+        except FileNotFoundError:
             print(f"Warning: Style file {filename} not found")
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Warning: Could not load style file {filename}: {e}")
+        else:
+            self._loaded_styles[filename] = content
+            return content
         
         return ""
     
@@ -42,11 +44,26 @@ class StyleManager:
         """Get dialog styles"""
         return self.load_style_file("dialogs.css")
     
+    def _mtime_ns(self, filename: str) -> Optional[int]:
+        """Get a style file's modification time, or None if it is missing"""
+        try:
+            return os.stat(self.styles_dir / filename).st_mtime_ns
+        except OSError:
+            return None
+    
     def get_combined_styles(self) -> str:
-        """Get all styles combined"""
-        main_styles = self.get_main_styles()
-        dialog_styles = self.get_dialog_styles()
-        return f"{main_styles}\n\n{dialog_styles}"
+        """Get all styles combined, rebuilt only when a style file changes"""
+        mtimes = (self._mtime_ns("main.css"), self._mtime_ns("dialogs.css"))
+        if self._combined_cache is not None:
+            if self._combined_cache[0] == mtimes:
+                return self._combined_cache[1]
+            # A file changed on disk, so its cached text is stale too
+            self._loaded_styles.clear()
+        combined = "\n\n".join(
+            (self.get_main_styles(), self.get_dialog_styles())
+        )
+        self._combined_cache = (mtimes, combined)
+        return combined
     
     def apply_styles(self, app: QApplication) -> None:
         """Apply styles to the application"""
@@ -57,6 +74,7 @@ class StyleManager:
     def clear_cache(self) -> None:
         """Clear the style cache"""
         self._loaded_styles.clear()
+        self._combined_cache = None
     
     def reload_styles(self, app: Optional[QApplication] = None) -> None:
         """Reload styles from files"""
@@ -1,26 +1,95 @@
+import os
 import sqlite3
 import sys
 from pathlib import Path
 
 import pytest
+from PyQt5.QtWidgets import QApplication
 
-sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
+# Make the application modules importable from every test module
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-from professional_invoice_manager.db import init_database  # noqa: E402
+from main_with_management import invalidate_products_cache  # noqa: E402
+from professional_invoice_manager.db import (  # noqa: E402
+    close_db,
+    init_database,
+)
+from professional_invoice_manager.dialogs import (  # noqa: E402
+    invalidate_partners_cache,
+)
 
 
-@pytest.fixture(autouse=True)
-def in_memory_db(monkeypatch):
+@pytest.fixture(scope="session")
+def app():
+    """Provide the QApplication shared by the whole test session."""
+    yield QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope="session")
+def schema_template():
+    """Private in-memory database holding the initialized schema."""
+    template = sqlite3.connect(":memory:")
+    init_database(template)
+    yield template
+    template.close()
+
+
+@pytest.fixture(scope="session")
+def shared_memory_db(schema_template):
+    """Route every sqlite3.connect call to one shared in-memory database.
+
+    The patch spans the whole session so session-scoped fixtures such as
+    main_window never open the real database file.
+    """
     original_connect = sqlite3.connect
     root_conn = original_connect("file::memory:?cache=shared", uri=True)
     root_conn.row_factory = sqlite3.Row
+    schema_template.backup(root_conn)
 
     def connect(*args, **kwargs):
-        conn = original_connect("file::memory:?cache=shared", uri=True)
+        kwargs.pop("uri", None)
+        conn = original_connect(
+            "file::memory:?cache=shared", uri=True, **kwargs
+        )
         conn.row_factory = sqlite3.Row
         return conn
 
-    monkeypatch.setattr(sqlite3, "connect", connect)
-    init_database()
-    yield
+    sqlite3.connect = connect
+    yield root_conn
+    sqlite3.connect = original_connect
     root_conn.close()
+
+
+@pytest.fixture(scope="session")
+def main_window(app, shared_memory_db):
+    """Provide one MainWindow for tests that only inspect it."""
+    from main_with_management import MainWindow
+
+    window = MainWindow()
+    close_db()
+    yield window
+    window.deleteLater()
+
+
+@pytest.fixture
+def window(app, in_memory_db):
+    """Provide a MainWindow of the test's own, released afterwards."""
+    from main_with_management import MainWindow
+
+    window = MainWindow()
+    yield window
+    window.deleteLater()
+
+
+@pytest.fixture(autouse=True)
+def in_memory_db(shared_memory_db, schema_template):
+    # Copy the prepared schema and seed data instead of rebuilding them
+    schema_template.backup(shared_memory_db)
+    # Cached rows from an earlier test's database would be stale
+    invalidate_partners_cache()
+    invalidate_products_cache()
+    yield
+    close_db()
@@ -1,57 +1,44 @@
 import logging
-import os
-from pathlib import Path
 import sqlite3
-import sys
+import threading
 import time
 
-from PyQt5.QtWidgets import QApplication
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-
-from main_with_management import (  # noqa: E402
+from main_with_management import (
     get_db,
     init_database,
-    MainWindow,
 )
-import professional_invoice_manager.dialogs as dialogs  # noqa: E402
-from professional_invoice_manager.dialogs import (  # noqa: E402
+from professional_invoice_manager.db import (
+    close_db,
+    get_readonly_conn,
+    transaction,
+)
+import professional_invoice_manager.dialogs as dialogs
+from professional_invoice_manager.dialogs import (
     InvoiceFormDialog,
     PartnerFormDialog,
     ProductFormDialog,
 )
-from professional_invoice_manager.pages import (  # noqa: E402
+from professional_invoice_manager.pages import (
     InvoiceListPage,
     PartnerListPage,
     ProductListPage,
 )
 
 
-@pytest.fixture(scope="module")
-def app():
-    """Provide a shared QApplication instance."""
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 def test_invoice_functionality():
     """Invoice table has required columns and supports inserts."""
-    init_database()
     with get_db() as conn:
         cursor = conn.execute("PRAGMA table_info(invoice)")
-        columns = [row[1] for row in cursor.fetchall()]
-        for col in [
+        columns = {row[1] for row in cursor.fetchall()}
+        assert {
             "id",
             "number",
             "direction",
             "partner_id",
             "created_utc",
-        ]:
-            assert col in columns
+        } <= columns
 
         invoice_count = conn.execute(
             "SELECT COUNT(*) FROM invoice"
@@ -61,32 +48,138 @@ def test_invoice_functionality():
         partner = conn.execute("SELECT id FROM partner LIMIT 1").fetchone()
         assert partner is not None
 
-        test_number = f"TEST-{int(time.time())}"
-        conn.execute(
-            "INSERT INTO invoice (number, direction, partner_id, created_utc) "
-            "VALUES (?, ?, ?, ?)",
-            (test_number, "sale", partner["id"], int(time.time())),
-        )
-        conn.commit()
-        inserted = conn.execute(
-            "SELECT COUNT(*) FROM invoice WHERE number = ?",
-            (test_number,),
+        now = int(time.time())
+        rows = [
+            (f"TEST-{now}-{direction}", direction, partner["id"], now)
+            for direction in ("sale", "purchase")
+        ]
+        # Insert and clean up under a single commit
+        with transaction(conn):
+            conn.executemany(
+                "INSERT INTO invoice "
+                "(number, direction, partner_id, created_utc) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            # The cleanup's rowcount confirms the rows were stored
+            deleted = conn.execute(
+                "DELETE FROM invoice WHERE number LIKE ?",
+                (f"TEST-{now}-%",),
+            ).rowcount
+        assert deleted == len(rows)
+
+
+def test_transaction_rolls_back_on_error():
+    """A failing statement undoes the earlier writes of the transaction."""
+    insert = (
+        "INSERT INTO product (sku, name, unit_price_cents) "
+        "VALUES ('TX-1', 'Tranzakció', 100)"
+    )
+    with pytest.raises(sqlite3.IntegrityError):
+        with transaction(immediate=True) as conn:
+            conn.execute(insert)
+            conn.execute(insert)
+    with get_db() as conn:
+        count = conn.execute(
+            "SELECT COUNT(*) FROM product WHERE sku = 'TX-1'"
         ).fetchone()[0]
-        assert inserted == 1
-        conn.execute("DELETE FROM invoice WHERE number = ?", (test_number,))
-        conn.commit()
+    assert count == 0
+
+
+def test_init_database_skips_current_schema():
+    """A database at the current schema version is not reseeded."""
+    with get_db() as conn:
+        conn.execute("DELETE FROM product")
+    init_database()
+    with get_db() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM product").fetchone()[0]
+    assert count == 0
+
+
+def test_init_database_keeps_newer_schema():
+    """A database written by a newer release is not downgraded."""
+    with get_db() as conn:
+        conn.execute("PRAGMA user_version = 99")
+    init_database()
+    with get_db() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    assert version == 99
+
+
+def test_readonly_conn_rejects_writes():
+    """The read-only connection can query but not modify data."""
+    conn = get_readonly_conn()
+    assert conn is not get_db()
+    assert conn.execute("SELECT COUNT(*) FROM partner").fetchone()[0] > 0
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM partner")
+
+
+def test_get_db_connection_per_thread():
+    """Each thread gets and closes its own shared connection."""
+    main_conn = get_db()
+    worker = {}
+
+    def use_db():
+        worker["conn"] = get_db()
+        worker["same"] = get_db() is worker["conn"]
+        close_db()
+
+    thread = threading.Thread(target=use_db)
+    thread.start()
+    thread.join()
+    assert worker["same"]
+    assert worker["conn"] is not main_conn
+    assert get_db() is main_conn
 
 
 def test_all_dialog_classes(app):
     """Dialog classes can be instantiated."""
-    assert InvoiceFormDialog() is not None
-    assert ProductFormDialog() is not None
-    assert PartnerFormDialog() is not None
+    for cls in (InvoiceFormDialog, ProductFormDialog, PartnerFormDialog):
+        dialog = cls()
+        assert isinstance(dialog, cls)
+        dialog.deleteLater()
+
 
+def test_product_price_parsed_to_exact_cents(app):
+    """Prices are converted to cents without float rounding errors."""
+    dialog = ProductFormDialog()
+    for text, cents in [
+        ("1500", 150000),
+        ("27.47", 2747),
+        ("1.15", 115),
+        ("0.5", 50),
+        ("5.", 500),
+        ("-.5", -50),
+        ("--5", 0),
+        ("- 5", 0),
+        ("1_000", 0),
+        ("19.999", 1999),
+        ("abc", 0),
+        ("", 0),
+    ]:
+        dialog.price_edit.setText(text)
+        assert dialog.get_data()["unit_price_cents"] == cents
+
+
+def test_partner_dialog_instance_reused(app, monkeypatch):
+    """get_instance reuses one dialog and clears it between partners."""
+    # Start from, and leave behind, an empty class-level instance
+    monkeypatch.setattr(PartnerFormDialog, "_instance", None)
+    dialog = PartnerFormDialog.get_instance(
+        {"name": "Teszt Kft.", "tax_id": "12345678-1-42"}, "customer"
+    )
+    assert dialog.name_edit.text() == "Teszt Kft."
+    again = PartnerFormDialog.get_instance(partner_type="supplier")
+    assert again is dialog
+    assert again.name_edit.text() == ""
+    assert again.tax_edit.text() == ""
+    assert again.get_data()["kind"] == "supplier"
+    dialog.deleteLater()
 
-def test_main_window_functionality(app):
+
+def test_main_window_functionality(main_window):
     """MainWindow exposes required methods."""
-    window = MainWindow()
     required_methods = [
         "new_invoice",
         "new_product",
@@ -98,7 +191,51 @@ def test_main_window_functionality(app):
         "show_suppliers",
     ]
     for name in required_methods:
-        assert hasattr(window, name)
+        assert hasattr(main_window, name)
+
+
+def test_management_pages_built_on_first_show(window):
+    """Management pages are created lazily and only once."""
+    assert window.stack.count() == 1
+    window.show_products()
+    page = window.stack.currentWidget()
+    assert isinstance(page, ProductListPage)
+    window.show_list()
+    window.show_products()
+    assert window.stack.currentWidget() is page
+    assert window.stack.count() == 2
+
+
+def test_show_list_skips_refresh_when_current(window, monkeypatch):
+    """Showing the current, unchanged page does not requery it."""
+    calls = []
+    monkeypatch.setattr(
+        window.list_page, "refresh", lambda: calls.append(1)
+    )
+    window.show_list()
+    assert calls == []
+    window._dirty["list"] = True
+    window.show_list()
+    assert calls == [1]
+
+
+def test_insert_record(window):
+    """insert_record binds dialog data to the table's INSERT statement."""
+    window.insert_record(
+        "partner",
+        {
+            "name": "Új Beszállító Kft.",
+            "kind": "supplier",
+            "tax_id": None,
+            "address": None,
+        },
+    )
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT kind FROM partner WHERE name = ?",
+            ("Új Beszállító Kft.",),
+        ).fetchone()
+    assert row["kind"] == "supplier"
 
 
 def test_management_pages(app):
@@ -109,6 +246,27 @@ def test_management_pages(app):
     assert InvoiceListPage() is not None
 
 
+def test_partners_loaded_once(app, monkeypatch):
+    """Partner rows are queried once and reused until invalidated."""
+    first = InvoiceFormDialog()
+    app.processEvents()
+    monkeypatch.setattr(dialogs, "get_readonly_conn", None)
+    second = InvoiceFormDialog()
+    assert second.partner_combo.count() == first.partner_combo.count() > 0
+    assert second.partner_combo.itemData(0) == first.partner_combo.itemData(0)
+
+
+def test_partner_selected_after_deferred_load(app):
+    """An invoice's partner is selected once the partners are loaded."""
+    dialog = InvoiceFormDialog({"number": "INV-1", "partner_id": 2})
+    assert dialog.partner_combo.count() == 0
+    app.processEvents()
+    assert dialog.partner_combo.count() > 0
+    assert dialog.partner_combo.currentData() == 2
+    cached = InvoiceFormDialog({"number": "INV-2", "partner_id": 3})
+    assert cached.partner_combo.currentData() == 3
+
+
 def test_load_partners_db_error(monkeypatch, caplog, app):
     def raise_error():
         raise sqlite3.Error("boom")
@@ -118,12 +276,13 @@ def test_load_partners_db_error(monkeypatch, caplog, app):
     def fake_warning(*args, **kwargs):
         warned["called"] = True
 
-    monkeypatch.setattr(dialogs, "get_db", raise_error)
+    monkeypatch.setattr(dialogs, "get_readonly_conn", raise_error)
     monkeypatch.setattr(
         dialogs.QMessageBox, "warning", staticmethod(fake_warning)
     )
     with caplog.at_level(logging.ERROR):
         dialog = InvoiceFormDialog()
+        app.processEvents()
     assert dialog.partner_combo.count() == 0
     assert warned.get("called")
     assert any(
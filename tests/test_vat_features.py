@@ -1,45 +1,39 @@
 """Tests for VAT summary calculations and widget."""
 
-from collections import defaultdict
-import os
-from pathlib import Path
-import sys
-
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import pytest  # noqa: E402
-from main_with_management import (  # noqa: E402
+from main_with_management import get_db
+from professional_invoice_manager.pages import (
     InvoiceDetailWidget,
-    get_db,
-    init_database,
 )
 
+SAMPLE_ITEMS = [
+    {"qty": 2, "unit_price_cents": 100000, "vat_rate": 27},
+    {"qty": 1, "unit_price_cents": 50000, "vat_rate": 18},
+    {"qty": 3, "unit_price_cents": 200000, "vat_rate": 27},
+    {"qty": 1, "unit_price_cents": 75000, "vat_rate": 5},
+]
+
 
 def _compute_vat_breakdown(items):
-    breakdown = defaultdict(lambda: {"net": 0.0, "vat": 0.0, "gross": 0.0})
+    # Sum exact integers per rate: net in cents and VAT in cents * 100
+    totals = {}
     for item in items:
-        quantity = item["qty"]
-        unit_price = item["unit_price_cents"] / 100.0
         rate = item["vat_rate"]
-        line_net = quantity * unit_price
-        line_vat = line_net * rate / 100.0
-        breakdown[rate]["net"] += line_net
-        breakdown[rate]["vat"] += line_vat
-        breakdown[rate]["gross"] += line_net + line_vat
-    return dict(breakdown)
+        net_cents = item["qty"] * item["unit_price_cents"]
+        sums = totals.get(rate)
+        if sums is None:
+            sums = totals[rate] = [0, 0]
+        sums[0] += net_cents
+        sums[1] += net_cents * rate
+    breakdown = {}
+    for rate, (net_cents, vat_cents_x100) in totals.items():
+        net = net_cents / 100
+        vat = vat_cents_x100 / 10000
+        breakdown[rate] = {"net": net, "vat": vat, "gross": net + vat}
+    return breakdown
 
 
 def test_vat_summary():
-    init_database()
-
-    items = [
-        {"qty": 2, "unit_price_cents": 100000, "vat_rate": 27},
-        {"qty": 1, "unit_price_cents": 50000, "vat_rate": 18},
-        {"qty": 3, "unit_price_cents": 200000, "vat_rate": 27},
-        {"qty": 1, "unit_price_cents": 75000, "vat_rate": 5},
-    ]
-    breakdown = _compute_vat_breakdown(items)
+    breakdown = _compute_vat_breakdown(SAMPLE_ITEMS)
     expected = {
         27: {"net": 8000.0, "vat": 2160.0, "gross": 10160.0},
         18: {"net": 500.0, "vat": 90.0, "gross": 590.0},
@@ -52,28 +46,39 @@ def test_vat_summary():
 
 def test_database_vat_data():
     with get_db() as conn:
-        invoice = conn.execute(
-            """
-            SELECT i.id, COUNT(ii.id) AS item_count
-            FROM invoice i
-            LEFT JOIN invoice_item ii ON i.id = ii.invoice_id
-            GROUP BY i.id
-            HAVING item_count > 0
-            LIMIT 1
-            """
-        ).fetchone()
-        if not invoice:
-            pytest.skip("No invoices with items found")
-
-        items = conn.execute(
+        partner_id = conn.execute("SELECT id FROM partner").fetchone()[0]
+        product_id = conn.execute("SELECT id FROM product").fetchone()[0]
+        invoice_id = conn.execute(
+            "INSERT INTO invoice (number, direction, partner_id, created_utc) "
+            "VALUES (?, ?, ?, ?)",
+            ("VAT-DATA", "sale", partner_id, 0),
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO invoice_item "
+            "(invoice_id, product_id, qty, unit_price_cents, vat_rate) "
+            "VALUES (:invoice_id, :product_id, :qty, :unit_price_cents, "
+            ":vat_rate)",
+            [
+                dict(item, invoice_id=invoice_id, product_id=product_id)
+                for item in SAMPLE_ITEMS
+            ],
+        )
+        # Per-rate totals of the stored items, aggregated in one query
+        rows = conn.execute(
             """
-            SELECT ii.qty, ii.unit_price_cents, ii.vat_rate
-            FROM invoice_item ii
-            WHERE ii.invoice_id = ?
+            SELECT vat_rate,
+                   SUM(qty * unit_price_cents) AS net_cents,
+                   SUM(qty * unit_price_cents * vat_rate) AS vat_cents_x100
+            FROM invoice_item
+            WHERE invoice_id = ?
+            GROUP BY vat_rate
             """,
-            (invoice["id"],),
+            (invoice_id,),
         ).fetchall()
 
-    breakdown = _compute_vat_breakdown(items)
-    assert breakdown
-    assert all(data["gross"] > 0 for data in breakdown.values())
+    expected = _compute_vat_breakdown(SAMPLE_ITEMS)
+    assert {row["vat_rate"] for row in rows} == set(expected)
+    for row in rows:
+        totals = expected[row["vat_rate"]]
+        assert row["net_cents"] / 100 == totals["net"]
+        assert row["vat_cents_x100"] / 10000 == totals["vat"]